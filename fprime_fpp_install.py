@@ -1,45 +1,57 @@
 """ install.py:
 
 Installs the FPP tool suite based on the version of this installer package. It will use FPP_DOWNLOAD_CACHE environment
-variable to pull up previously downloaded items for users that wish to install offline.
+variable to pull up previously downloaded items for users that wish to install offline. Additional release mirrors may
+be supplied as a whitespace-separated list in the FPP_TOOLS_MIRRORS environment variable.
 """
-import atexit
+import functools
+import hashlib
+import http.client
 import json
 import os
 import platform
+import queue
 import re
 import shutil
 import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
 import urllib.request
 import urllib.error
 
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, List
 from contextlib import contextmanager
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 TEMPORARY_VERSION_FILE = Path(tempfile.gettempdir()) / "fprime_versions.json"
 FPP_TOOLS_VARIABLE = "FPP_TOOLS_VERSION"
+VERSION_REGEX = re.compile(r"^v\d+\.\d+\.\d+$")
+HASH_REGEX = re.compile(r"^[a-fA-F0-9]{8,40}$")
+FULL_VERSION_REGEX = re.compile(r"^(v\d+\.\d+\.\d+)-(\d+)-g([a-fA-F0-9]{8,40})$")
+UNPACK_DIR_REGEX = re.compile(r"^fpp-[a-f0-9]{16}$")
 
 
-def clean_at_exit(file_or_directory):
-    """Register file for cleanup at exit"""
-
-    def clean_version_file(path):
-        """Clean up the version file iff it is created"""
-        print(f"-- INFO  -- Removing: {path}")
+def clean_path(path: Path):
+    """Removes a file or directory, ignoring errors"""
+    print(f"-- INFO  -- Removing: {path}")
+    if Path(path).is_dir():
         shutil.rmtree(path, ignore_errors=True)
-
-    atexit.register(clean_version_file, file_or_directory)
-
-
-# Force the temporary version file to be removed
-clean_at_exit(TEMPORARY_VERSION_FILE)
+    else:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
 
 
+@functools.lru_cache(maxsize=None)
 def read_version_from_temp(file: Path, fallback=None, safe=False):
     """Reads the versioning information from temporary directory
 
@@ -47,10 +59,12 @@ def read_version_from_temp(file: Path, fallback=None, safe=False):
     file is read and processed to determine the FPP_TOOLS_VERSION to install. It is associated with a PPID file to
     ensure that this file was created within the same parent process tree. This ensures that it is valid.  If the PPID
     field is not set, it will assume the file is correct.
+
+    The parse result is cached per arguments, and orjson is used for parsing when it is installed.
     """
     try:
         with open(file, "r") as file_handle:
-            versions = json.load(file_handle)
+            versions = json_loads(file_handle.read())
         version = versions[FPP_TOOLS_VARIABLE]
         if safe or versions["setup_ppid"] == os.getppid():
             print(
@@ -69,6 +83,20 @@ def read_version_from_temp(file: Path, fallback=None, safe=False):
     return fallback
 
 
+@functools.lru_cache(maxsize=None)
+def find_tools_version():
+    """Finds the fpp tools version from the environment and temporary version file, None if not found
+
+    Cached such that the environment and temporary version file are consulted only once per process.
+    """
+    version = os.environ.get(
+        FPP_TOOLS_VARIABLE, None
+    )  # 'sdist' and local from environment file
+    return read_version_from_temp(
+        TEMPORARY_VERSION_FILE, version
+    )  # fprime package install, read checking ppid
+
+
 def setup_version():
     """Setup the version information for the fpp tools that will be installed
 
@@ -86,12 +114,7 @@ def setup_version():
 
     The code also creates the version file, for shipping as the default with the package
     """
-    version = os.environ.get(
-        FPP_TOOLS_VARIABLE, None
-    )  # 'sdist' and local from environment file
-    version = read_version_from_temp(
-        TEMPORARY_VERSION_FILE, version
-    )  # fprime package install, read checking ppid
+    version = find_tools_version()
 
     # Check for the case when the version was not found
     if version is None:
@@ -102,30 +125,24 @@ def setup_version():
     return version
 
 
+@functools.lru_cache(maxsize=None)
 def get_package_version(tools_version):
     """Package version from the tool version"""
-    version_match_string = r"(v\d+\.\d+\.\d+)"
-    hash_match_string = r"([a-fA-F0-9]{8,40})"
-    full_version_string = fr"{ version_match_string }-(\d+)-g{ hash_match_string }"
-
-    hash_matcher = re.compile(hash_match_string)
-    full_version_matcher = re.compile(full_version_string)
-
     # Base settings
     version = "v0.0.0"
     commits = "999"
     hash = "00000000"
+    full_version_match = FULL_VERSION_REGEX.match(tools_version)
 
     # Exact match of a version string, should be returned right back:
-    if re.match(fr"^{ version_match_string }$", tools_version):
+    if VERSION_REGEX.match(tools_version):
         return tools_version
-    elif hash_matcher.match(tools_version):
+    elif HASH_REGEX.match(tools_version):
         hash = tools_version[:8]
-    elif full_version_matcher.match(tools_version):
-        matched = full_version_matcher.match(tools_version)
-        version = matched.group(1)
-        commits = matched.group(2)
-        hash = matched.group(3)[:8]
+    elif full_version_match:
+        version = full_version_match.group(1)
+        commits = full_version_match.group(2)
+        hash = full_version_match.group(3)[:8]
     return f"{ version }.dev{ commits }+g{ hash }"
 
 
@@ -133,33 +150,50 @@ __FPP_TOOLS_VERSION__ = setup_version()
 PACKAGE_VERSION = get_package_version(__FPP_TOOLS_VERSION__)
 WORKING_DIR = Path(tempfile.gettempdir()) / "__FPP_WORKING_DIR__"
 FPP_ARTIFACT_PREFIX = "native-fpp"
+PLATFORM_SUFFIX = f"{ platform.system() }-{ platform.machine() }"
+IS_WINDOWS = platform.system() == "Windows"
 FPP_COMPRESSION_EXT = ".tar.gz"
 GITHUB_URL = os.environ.get("FPP_TOOLS_REPO", "https://github.com/fprime-community/fpp")
+GITHUB_MIRRORS = os.environ.get("FPP_TOOLS_MIRRORS", "").split()
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_TIMEOUT = 30
 GITHUB_RELEASE_URL = "{GITHUB_URL}/releases/download/{version}/{artifact_string}"
 SBT_URL = "https://github.com/sbt/sbt/releases/download/v1.6.2/sbt-1.6.2.tgz"
+TAR_BUFFER_SIZE = 2 * 1024 * 1024
+RESPONSE_BUFFER_SIZE = 256 * 1024
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
 
 
-@contextmanager
-def safe_chdir(path):
-    """Safely change directory, returning when done."""
-    origin = os.getcwd()
-    try:
-        os.chdir(path)
-        yield
-    finally:
-        os.chdir(origin)
+@functools.lru_cache(maxsize=None)
+def get_artifact_stem(version: str) -> str:
+    """Gets the unpacked directory name of the package. e.g. native-fpp-Darwin-x86_64"""
+    return f"{ FPP_ARTIFACT_PREFIX }-{ PLATFORM_SUFFIX }"
 
 
+@functools.lru_cache(maxsize=None)
 def get_artifact_string(version: str) -> str:
-    """Gets the platform string for the package. e.g. Darwin-x86_64"""
-    return f"{ FPP_ARTIFACT_PREFIX }-{ platform.system() }-{ platform.machine() }{ FPP_COMPRESSION_EXT }"
+    """Gets the artifact file name of the package. e.g. native-fpp-Darwin-x86_64.tar.gz"""
+    return f"{ get_artifact_stem(version) }{ FPP_COMPRESSION_EXT }"
+
+
+def wget(url: str, dest_dir: Path) -> Path:
+    """wget functionality to fetch a URL into dest_dir
 
+    Copies the response to disk in DOWNLOAD_CHUNK_SIZE chunks rather than urlretrieve's 8 KiB blocks.
 
-def wget(url: str):
-    """wget functionality to fetch a URL"""
+    Returns:
+        path to the downloaded file
+    """
+    destination = Path(dest_dir) / Path(url).name
     print(f"-- INFO  -- Fetching FPP tools at { url }", file=sys.stderr)
     try:
-        urllib.request.urlretrieve(url, Path(url).name)
+        with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response, open(
+            destination, "wb", buffering=0
+        ) as output:
+            shutil.copyfileobj(response, output, DOWNLOAD_CHUNK_SIZE)
+        return destination
     except urllib.error.HTTPError as error:
         print(
             f"-- WARN  -- Failed to retrieve { url } with error: { error }",
@@ -168,59 +202,312 @@ def wget(url: str):
         raise
 
 
-def github_release_download(version: str):
-    """Attempts to get FPP via the FPP release"""
+def open_release(release_url: str):
+    """Opens a stream to a release artifact
+
+    Returns:
+        open response streaming the release artifact, None if the release does not exist at this url
+    """
+    print(f"-- INFO  -- Fetching FPP tools at { release_url }", file=sys.stderr)
     try:
-        release_url = GITHUB_RELEASE_URL.format(
-            GITHUB_URL=GITHUB_URL,
+        return urllib.request.urlopen(release_url, timeout=DOWNLOAD_TIMEOUT)
+    except OSError as error:
+        print(
+            f"-- WARN  -- Failed to retrieve { release_url } with error: { error }",
+            file=sys.stderr,
+        )
+        # Check if this is a real error or not available error
+        if getattr(error, "code", None) != 404:
+            raise
+    return None
+
+
+def github_release_download(version: str):
+    """Attempts to get FPP via the FPP release
+
+    The release is requested from GITHUB_URL and any mirrors concurrently. The first mirror to answer with the artifact
+    is used. Requests that lose the race run on daemon threads, such that they cannot hold up interpreter exit, and close
+    their own responses.
+
+    Returns:
+        open response streaming the release artifact, None if the release is not available
+    Raises:
+        Exception: the failure of a request when no url supplied the artifact and none reported it missing (404)
+    """
+    release_urls = [
+        GITHUB_RELEASE_URL.format(
+            GITHUB_URL=url,
             version=version,
             artifact_string=get_artifact_string(version),
         )
-        wget(release_url)
-    except urllib.error.HTTPError as error:
-        retry_likely = "404" not in str(error)
-        retry_error = f"Retrying will likely resolve the problem."
-        # Check if this is a real error or not available error
-        if retry_likely:
-            print(f"-- INFO  -- { retry_error }", file=sys.stderr)
-            sys.exit(-1)
+        for url in [GITHUB_URL] + GITHUB_MIRRORS
+    ]
+    results = queue.Queue()
+    workers = threading.BoundedSemaphore(DOWNLOAD_WORKERS)
+    winner_lock = threading.Lock()
+    winner_found = threading.Event()
+
+    def fetch(release_url):
+        """Opens a release url, reporting the outcome unless another request has already won"""
+        try:
+            with workers:
+                response = open_release(release_url)
+        except Exception as error:
+            results.put(error)
+            return
+        with winner_lock:
+            if response is not None and winner_found.is_set():
+                response.close()
+                return
+            if response is not None:
+                winner_found.set()
+        results.put(response)
+
+    for release_url in release_urls:
+        threading.Thread(target=fetch, args=(release_url,), daemon=True).start()
+
+    # Every request reports exactly once (including unexpected exceptions) until one wins, so this loop terminates
+    retry_error = None
+    not_found = False
+    for _ in release_urls:
+        outcome = results.get()
+        if isinstance(outcome, Exception):
+            retry_error = outcome
+        elif outcome is None:
+            not_found = True
+        else:
+            return outcome
+
+    # A 404 means the release does not exist, so unreachable mirrors would not have had it either
+    if retry_error is not None and not not_found:
+        raise retry_error
+    return None
+
+
+def extract_tar_stream(stream, destination: Path):
+    """Extracts a gzipped tar stream into destination
+
+    The archive is read as a stream (single pass, no seeking) through large buffers as the default 16 KiB copy size
+    makes extraction needlessly slow. Streaming mode also turns any accidental random member access (getmembers,
+    extractfile by name) into an error rather than a silent second read of the archive. The "data" extraction filter is
+    applied where python supports it to reject members escaping the destination.
+    """
+    destination.mkdir(parents=True, exist_ok=True)
+    with tarfile.open(fileobj=stream, mode="r|gz", bufsize=TAR_BUFFER_SIZE) as archive:
+        archive.copybufsize = TAR_BUFFER_SIZE
+        if hasattr(tarfile, "data_filter"):
+            archive.extraction_filter = tarfile.data_filter
+        archive.extractall(destination)
+
+
+def find_native_tar():
+    """Finds a native tar executable, None if unavailable
+
+    On Windows only the libarchive-based tar shipped in System32 (Windows 10 and newer) is used. Other tars found on the
+    PATH (e.g. GNU tar from Git for Windows) mistake drive letters for remote hosts.
+    """
+    if IS_WINDOWS:
+        system_tar = Path(os.environ.get("SystemRoot", r"C:\Windows")) / "System32" / "tar.exe"
+        return str(system_tar) if system_tar.exists() else None
+    return shutil.which("tar")
+
+
+def native_tar_command(source: str, destination: Path):
+    """Native tar command extracting gzipped source ("-" for stdin) into destination
+
+    Uses pigz for parallel decompression when on the PATH. GNU tar and bsdtar pass -d to the compress program themselves.
+
+    Returns:
+        command list, None if native tar is unavailable
+    """
+    tar = find_native_tar()
+    if not tar:
+        return None
+    pigz = shutil.which("pigz") if not IS_WINDOWS else None
+    decompress = [f"--use-compress-program={ pigz }", "-xf"] if pigz else ["-xzf"]
+    return [tar] + decompress + [source, "-C", str(destination)]
+
+
+def extract_tar_response(response, destination: Path):
+    """Extracts a gzipped tar http response into destination
+
+    When native tar is available the response is piped into it such that decompression and member writes run in a
+    separate native process concurrently with the download. Otherwise the response is first downloaded into a spooled
+    temporary file, held in memory up to SPOOL_MAX_SIZE, such that python's extraction reads one contiguous buffer
+    rather than interleaving small socket reads with decompression.
+    """
+    command = native_tar_command("-", destination)
+    if command is None:
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+            shutil.copyfileobj(response, spool, RESPONSE_BUFFER_SIZE)
+            spool.seek(0)
+            extract_tar_stream(spool, destination)
+        return
+    destination.mkdir(parents=True, exist_ok=True)
+    with subprocess.Popen(command, stdin=subprocess.PIPE) as process:
+        try:
+            shutil.copyfileobj(response, process.stdin, RESPONSE_BUFFER_SIZE)
+        except BrokenPipeError:
+            pass  # tar exited early, reported via its return code below
+        finally:
+            # Closing flushes buffered input, which fails the same way when tar exited early
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+    if process.returncode != 0:
+        print("-- ERROR -- Native tar failed to extract the release stream")
+        sys.exit(-1)
+
+
+def stream_release_install(working_dir: Path, version: str) -> Path:
+    """Download and extract the release artifact in one pass
+
+    The HTTP response is fed straight into the tar extraction such that the archive never lands on disk and
+    decompression overlaps with the network transfer. Extraction happens in a staging directory beside working_dir and
+    the tools are renamed into place only once extraction succeeded, as a partial extraction left in working_dir would
+    be mistaken for an installation by later runs.
+
+    Returns:
+        Path to install if the release was available, None if not
+    """
+    response = github_release_download(version)
+    if response is None:
+        return None
+    output_dir = working_dir / get_artifact_stem(version)
+    staging_dir = Path(tempfile.mkdtemp(prefix="__FPP_STAGING__", dir=working_dir.parent))
+    try:
+        with response:
+            extract_tar_response(response, staging_dir)
+        (staging_dir / output_dir.name).rename(output_dir)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    return output_dir
+
 
+def extract_tar_file(artifact: Path, destination: Path):
+    """Extracts a gzipped tar file into destination
 
-def prepare_cache_dir(cache_directory: Path, version: str) -> Path:
+    Native tar is much faster than python's tarfile and is used when available. Python's tarfile remains the fallback
+    (e.g. older Windows or missing/failed native tar).
+    """
+    command = native_tar_command(str(artifact), destination)
+    if command is not None:
+        completed = subprocess.run(command)
+        if completed.returncode == 0:
+            return
+        print(f"-- WARN  -- Native tar failed to extract { artifact }, falling back to python tarfile")
+    with open(artifact, "rb", buffering=TAR_BUFFER_SIZE) as raw:
+        extract_tar_stream(raw, destination)
+
+
+def hash_file(path: Path) -> str:
+    """Computes the sha256 digest of a file reading it in HASH_CHUNK_SIZE chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_unpack_stamp(stamp: Path):
+    """Reads the artifact hash recorded in an unpack stamp, None if the stamp is missing or invalid"""
+    try:
+        return json.loads(stamp.read_text()).get("sha256")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def prune_unpack_dirs(cache_directory: Path, keep: Path):
+    """Removes hash-keyed unpack directories of previous artifacts from the cache directory"""
+    for path in list_directory(cache_directory):
+        if path != keep and UNPACK_DIR_REGEX.match(path.name) and path.is_dir():
+            clean_path(path)
+
+
+def prepare_cache_dir(cache_directory: Path, version: str, working_dir: Path) -> Path:
     """Prepare the cache directory for the installation artifact
 
+    The artifact is unpacked into a directory keyed by its sha256 hash. A stamp file recording that hash is written once
+    extraction completes such that subsequent installs of the same artifact reuse the unpacked tools without extracting.
+    Unpack directories of previous artifacts are removed at that point. When the cache directory is not writable, the
+    artifact is unpacked into working_dir instead and nothing is cached.
+
     Returns:
         Path to install if the cache directory is ready, None if not (usually no artifacts available)
     """
     artifact = cache_directory / get_artifact_string(version)
     if not artifact.exists():
         return None
-    # Decompress tarfile in preparation for installation
-    output_dir = Path(str(artifact).replace(".tar.gz", ""))
-    with tarfile.open(artifact) as archive:
-        archive.extractall(".")
+    artifact_hash = hash_file(artifact)
+    unpack_dir = cache_directory / f"fpp-{ artifact_hash[:16] }"
+    output_dir = unpack_dir / get_artifact_stem(version)
+    stamp = unpack_dir / ".stamp"
+    if read_unpack_stamp(stamp) == artifact_hash and output_dir.is_dir():
+        print(f"-- INFO  -- Reusing unpacked tools at { output_dir }")
+        return output_dir
+
+    # Decompress tarfile in preparation for installation, clearing any partial extraction
+    shutil.rmtree(unpack_dir, ignore_errors=True)
+    try:
+        unpack_dir.mkdir(parents=True)
+    except OSError as error:
+        print(f"-- WARN  -- Cannot unpack into { cache_directory } ({ error }), using { working_dir }")
+        unpack_dir = working_dir
+        output_dir = working_dir / get_artifact_stem(version)
+        stamp = None
+    extract_tar_file(artifact, unpack_dir)
+    if not output_dir.is_dir():
+        print(f"-- ERROR -- { artifact } did not contain { output_dir.name }")
+        sys.exit(-1)
+    if stamp is not None:
+        prune_unpack_dirs(cache_directory, unpack_dir)
+        stamp.write_text(json.dumps({"artifact": artifact.name, "sha256": artifact_hash}))
     return output_dir
 
 
+def find_unpacked_tools(cache_directory: Path, version: str) -> Path:
+    """Finds tools already unpacked in the cache directory
+
+    A cache directory may hold the unpacked release (e.g. native-fpp-Linux-x86_64) in addition to, or instead of, the
+    artifact. When that directory exists and is non-empty it is used directly and no extraction is performed.
+
+    Returns:
+        Path to install if unpacked tools were found, None if not
+    """
+    unpacked = cache_directory / get_artifact_stem(version)
+    if not list_directory(unpacked, missing_ok=True):
+        return None
+    print(f"-- INFO  -- Using unpacked tools at { unpacked }")
+    return unpacked
+
+
 def install_fpp(working_dir: Path) -> Path:
     """Installs FPP of the specified version"""
     version = __FPP_TOOLS_VERSION__
     cache_directory = Path(os.environ.get("FPP_DOWNLOAD_CACHE", working_dir))
 
-    # Put everything in the current working directory
-    with safe_chdir(working_dir):
-        # Cache directory not supplied, must download the artifacts.
-        if working_dir == cache_directory:
-            github_release_download(version)
-
-        # Check cache/download directory for artifact.
-        tools_install_directory = prepare_cache_dir(cache_directory, version)
-        if not tools_install_directory:
+    # Cache directory not supplied, must download the artifacts. Otherwise check the cache directory for artifact.
+    if working_dir == cache_directory:
+        try:
+            tools_install_directory = stream_release_install(working_dir, version)
+        except (OSError, ValueError, tarfile.TarError, http.client.HTTPException) as error:
             print(
-                "-- WARN  -- Cached/released tools not found. Falling back to git clone."
+                f"-- ERROR -- Failed to download FPP tools release with error: { error }",
+                file=sys.stderr,
             )
-            tools_install_directory = install_fpp_via_git(cache_directory, version)
-        return tools_install_directory
+            print("-- INFO  -- Retrying will likely resolve the problem.", file=sys.stderr)
+            sys.exit(-1)
+    else:
+        tools_install_directory = find_unpacked_tools(
+            cache_directory, version
+        ) or prepare_cache_dir(cache_directory, version, working_dir)
+    if not tools_install_directory:
+        print(
+            "-- WARN  -- Cached/released tools not found. Falling back to git clone."
+        )
+        tools_install_directory = install_fpp_via_git(cache_directory, version)
+    return tools_install_directory
 
 
 def install_fpp_via_git(installation_directory: Path, version: str):
@@ -241,10 +528,7 @@ def install_fpp_via_git(installation_directory: Path, version: str):
             print(f"-- ERROR -- {tool} must exist on PATH")
             sys.exit(-1)
     with tempfile.TemporaryDirectory() as tools_directory:
-        os.chdir(tools_directory)
-        wget(SBT_URL)
-        with tarfile.open(os.path.basename(SBT_URL)) as archive:
-            archive.extractall(".")
+        extract_tar_file(wget(SBT_URL, Path(tools_directory)), Path(tools_directory))
         sbt_path = Path(tools_directory) / "sbt" / "bin"
         subprocess_environment = os.environ.copy()
         subprocess_environment["PATH"] = f"{ sbt_path }:{ os.environ.get('PATH') }"
@@ -267,16 +551,25 @@ def install_fpp_via_git(installation_directory: Path, version: str):
     return installation_directory
 
 
+def list_directory(directory: Path, missing_ok=False) -> List[Path]:
+    """Lists a directory in a single, closed scandir pass. Missing directories are empty only when missing_ok is set."""
+    try:
+        with os.scandir(directory) as entries:
+            return [Path(entry.path) for entry in entries]
+    except FileNotFoundError:
+        if not missing_ok:
+            raise
+        return []
+
+
 def iterate_fpp_tools(working_dir: Path) -> Iterable[Path]:
     """Iterates through FPP tools"""
-    untar_possibility = working_dir / get_artifact_string(
-        __FPP_TOOLS_VERSION__
-    ).replace(".tar.gz", "")
-    if not any(os.scandir(working_dir)):
-        working_dir = install_fpp(working_dir)
-    elif untar_possibility.exists() and any(os.scandir(untar_possibility)):
-        working_dir = untar_possibility
-    return working_dir.iterdir()
+    untar_possibility = working_dir / get_artifact_stem(__FPP_TOOLS_VERSION__)
+    tools = list_directory(working_dir, missing_ok=True)
+    if not tools:
+        return list_directory(install_fpp(working_dir))
+    untarred_tools = list_directory(untar_possibility) if untar_possibility in tools else []
+    return untarred_tools or tools
 
 
 @contextmanager
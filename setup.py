@@ -14,8 +14,9 @@ from setuptools.command.install import install
 
 from fprime_fpp_install import (
     clean_install_fpp,
-    clean_at_exit,
+    clean_path,
     PACKAGE_VERSION,
+    TEMPORARY_VERSION_FILE,
     WORKING_DIR,
 )
 
@@ -84,9 +85,12 @@ with clean_install_fpp() as lazy_executables:
     class FppInstall(install):
         def run(self):
             """install scripts for giles"""
-            clean_at_exit(WORKING_DIR)
-            for shadow, executable in cache_shadows():
-                shutil.copy(executable, shadow)
+            try:
+                for shadow, executable in cache_shadows():
+                    shutil.copy(executable, shadow)
+            finally:
+                clean_path(WORKING_DIR)
+                clean_path(TEMPORARY_VERSION_FILE)
             install.run(self)
 
     setup(